@@ -382,12 +382,13 @@ class IconScoreDatabase(ContextGetter):
         self._observer: Optional[DatabaseObserver] = None
 
         self._prefix_hash_key: bytes = self._make_prefix_hash_key()
+        # Separator is appended in advance to build hashed keys with a single concatenation
+        self._prefix_hash_key_with_separator: bytes = self._prefix_hash_key + b'|'
 
     def _make_prefix_hash_key(self) -> bytes:
-        data = [self.address.to_bytes()]
-        if self._prefix is not None:
-            data.append(self._prefix)
-        return b'|'.join(data)
+        if self._prefix is None:
+            return self.address.to_bytes()
+        return b'|'.join((self.address.to_bytes(), self._prefix))
 
     def get(self, key: bytes) -> bytes:
         """
@@ -466,7 +467,7 @@ class IconScoreDatabase(ContextGetter):
         :return: key bytes
         """
 
-        return b'|'.join((self._prefix_hash_key, key))
+        return self._prefix_hash_key_with_separator + key
 
     def _validate_ownership(self):
         """Prevent a SCORE from accessing the database of another SCORE
@@ -492,12 +493,11 @@ class IconScoreSubDatabase(object):
         self._score_db = score_db
 
         self._prefix_hash_key: bytes = self._make_prefix_hash_key()
+        self._prefix_hash_key_with_separator: bytes = self._prefix_hash_key + b'|'
 
     def _make_prefix_hash_key(self) -> bytes:
-        data = []
-        if self._prefix is not None:
-            data.append(self._prefix)
-        return b'|'.join(data)
+        # prefix is validated in __init__ so it is used as it is
+        return self._prefix
 
     def get(self, key: bytes) -> bytes:
         """
@@ -554,4 +554,4 @@ class IconScoreSubDatabase(object):
         :return: key bytes
         """
 
-        return b'|'.join((self._prefix_hash_key, key))
+        return self._prefix_hash_key_with_separator + key
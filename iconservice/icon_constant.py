@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import namedtuple
 from enum import IntFlag, unique, IntEnum, Enum, auto, Flag
 
 SYSTEM_ADDRESS = "cx0000000000000000000000000000000000000000"
@@ -90,16 +91,18 @@ class IssueDataKey:
     TOTAL = "total"
 
 
+IssueEventLogMeta = namedtuple("IssueEventLogMeta", ["event_signature", "data"])
+
 ISSUE_EVENT_LOG_MAPPER = {
-    IssueDataKey.PREP: {
-        "event_signature": "PRepIssued(int,int,int,int)",
-        "data": [IssueDataKey.IREP, IssueDataKey.RREP, IssueDataKey.TOTAL_DELEGATION,
-                 IssueDataKey.VALUE]
-    },
-    IssueDataKey.TOTAL: {
-        "event_signature": "ICXIssued(int,int,int,int)",
-        "data": []
-    }
+    IssueDataKey.PREP: IssueEventLogMeta(
+        event_signature="PRepIssued(int,int,int,int)",
+        data=(IssueDataKey.IREP, IssueDataKey.RREP, IssueDataKey.TOTAL_DELEGATION,
+              IssueDataKey.VALUE)
+    ),
+    IssueDataKey.TOTAL: IssueEventLogMeta(
+        event_signature="ICXIssued(int,int,int,int)",
+        data=()
+    )
 }
 
 ISSUE_CALCULATE_ORDER = [IssueDataKey.PREP]
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING
 
 from iconservice.icon_constant import IconScoreContextType, Revision
@@ -33,10 +34,23 @@ DICT_DB_ID = b'\x01'
 VAR_DB_ID = b'\x02'
 
 
+# Only small non-negative integer keys are cached
+# because an integer key given by a transaction can be arbitrarily large
+_MAX_CACHED_INT_KEY = 4096
+
+
 def get_encoded_key(key: V) -> bytes:
+    # Integer keys such as ArrayDB indices are encoded over and over again
+    if type(key) is int and 0 <= key < _MAX_CACHED_INT_KEY:
+        return _get_encoded_int_key(key)
     return ContainerUtil.encode_key(key)
 
 
+@lru_cache(maxsize=_MAX_CACHED_INT_KEY)
+def _get_encoded_int_key(key: int) -> bytes:
+    return int_to_bytes(key)
+
+
 class ContainerUtil(object):
 
     @classmethod
@@ -48,15 +62,12 @@ class ContainerUtil(object):
         :param var_key:
         :return:
         """
-        if container_cls == ArrayDB:
-            container_id = ARRAY_DB_ID
-        elif container_cls == DictDB:
-            container_id = DICT_DB_ID
-        else:
+        container_prefix: Optional[bytes] = _CONTAINER_PREFIXES.get(container_cls)
+        if container_prefix is None:
             raise InvalidParamsException(f'Unsupported container class: {container_cls}')
 
         encoded_key: bytes = get_encoded_key(var_key)
-        return b'|'.join([container_id, encoded_key])
+        return container_prefix + encoded_key
 
     @classmethod
     def encode_key(cls, key: K) -> bytes:
@@ -68,6 +79,11 @@ class ContainerUtil(object):
         if key is None:
             raise InvalidParamsException('key is None')
 
+        encoder = _KEY_ENCODERS.get(type(key))
+        if encoder is not None:
+            return encoder(key)
+
+        # Subclasses of the supported types are handled here
         if isinstance(key, int):
             bytes_key = int_to_bytes(key)
         elif isinstance(key, str):
@@ -82,6 +98,11 @@ class ContainerUtil(object):
 
     @classmethod
     def encode_value(cls, value: V) -> bytes:
+        encoder = _VALUE_ENCODERS.get(type(value))
+        if encoder is not None:
+            return encoder(value)
+
+        # Subclasses of the supported types are handled here
         if isinstance(value, int):
             byte_value = int_to_bytes(value)
         elif isinstance(value, str):
@@ -101,18 +122,10 @@ class ContainerUtil(object):
         if value is None:
             return get_default_value(value_type)
 
-        obj_value = None
-        if value_type == int:
-            obj_value = bytes_to_int(value)
-        elif value_type == str:
-            obj_value = value.decode()
-        elif value_type == Address:
-            obj_value = Address.from_bytes(value)
-        if value_type == bool:
-            obj_value = bool(bytes_to_int(value))
-        elif value_type == bytes:
-            obj_value = value
-        return obj_value
+        decoder = _DECODERS.get(value_type)
+        if decoder is None:
+            return None
+        return decoder(value)
 
     @classmethod
     def remove_prefix_from_iters(cls, iter_items: iter) -> iter:
@@ -128,14 +141,15 @@ class ContainerUtil(object):
         if isinstance(container, dict):
             cls.__put_to_db_internal(sub_db, container.items())
         elif isinstance(container, (list, set, tuple)):
-            cls.__put_to_db_internal(sub_db, enumerate(container))
+            cls.__put_to_db_internal(sub_db, enumerate(cls.__to_ordered_sequence(container)))
 
     @classmethod
     def get_from_db(cls, db: 'IconScoreDatabase', db_key: str, *args, value_type: type) -> Optional[K]:
         sub_db = db.get_sub_db(cls.encode_key(db_key))
         *args, last_arg = args
-        for arg in args:
-            sub_db = sub_db.get_sub_db(cls.encode_key(arg))
+        if args:
+            # Joining prefixes at once is the same as chaining get_sub_db() for each arg
+            sub_db = sub_db.get_sub_db(b'|'.join([cls.encode_key(arg) for arg in args]))
 
         byte_key = sub_db.get(cls.encode_key(last_arg))
         if byte_key is None:
@@ -145,16 +159,69 @@ class ContainerUtil(object):
     @classmethod
     def __put_to_db_internal(cls, db: Union['IconScoreDatabase', 'IconScoreSubDatabase'], iters: iter) -> None:
         for key, value in iters:
-            sub_db = db.get_sub_db(cls.encode_key(key))
+            db_key: bytes = cls.encode_key(key)
+            # Sub db is created only for a nested container
             if isinstance(value, dict):
-                cls.__put_to_db_internal(sub_db, value.items())
+                cls.__put_to_db_internal(db.get_sub_db(db_key), value.items())
             elif isinstance(value, (list, set, tuple)):
-                cls.__put_to_db_internal(sub_db, enumerate(value))
+                cls.__put_to_db_internal(db.get_sub_db(db_key), enumerate(cls.__to_ordered_sequence(value)))
             else:
-                db_key = cls.encode_key(key)
                 db_value = cls.encode_value(value)
                 db.put(db_key, db_value)
 
+    @classmethod
+    def __to_ordered_sequence(cls, container: Union[list, set, tuple]) -> Union[list, tuple]:
+        """Iteration order of set depends on hash values of its items,
+        so items of set are sorted to be stored with the same indexes all the time
+
+        Items which are not comparable with each other like Address are sorted by their repr()
+        """
+        if not isinstance(container, set):
+            return container
+
+        try:
+            return sorted(container)
+        except TypeError:
+            return sorted(container, key=repr)
+
+
+def _encode_str(value: str) -> bytes:
+    return value.encode('utf-8')
+
+
+def _bypass(value: bytes) -> bytes:
+    return value
+
+
+_KEY_ENCODERS = {
+    int: int_to_bytes,
+    str: _encode_str,
+    Address: Address.to_bytes,
+    bytes: _bypass,
+}
+
+_VALUE_ENCODERS = {
+    **_KEY_ENCODERS,
+    bool: int_to_bytes,
+}
+
+
+def _decode_str(value: bytes) -> str:
+    return value.decode()
+
+
+def _decode_bool(value: bytes) -> bool:
+    return bool(bytes_to_int(value))
+
+
+_DECODERS = {
+    int: bytes_to_int,
+    str: _decode_str,
+    Address: Address.from_bytes,
+    bool: _decode_bool,
+    bytes: _bypass,
+}
+
 
 class DictDB(object):
     """
@@ -228,14 +295,17 @@ class ArrayDB(object):
     :K: [int, str, Address, bytes]
     :V: [int, str, Address, bytes, bool]
     """
-    __SIZE = 'size'
-    __SIZE_BYTE_KEY = get_encoded_key(__SIZE)
+    # Encoded key of 'size' which is the same as 'size'.encode('utf-8')
+    __SIZE_BYTE_KEY = b'size'
 
     def __init__(self, var_key: K, db: 'IconScoreDatabase', value_type: type) -> None:
         prefix: bytes = ContainerUtil.create_db_prefix(type(self), var_key)
         self._db = db.get_sub_db(prefix)
         self.__value_type = value_type
-        self.__legacy_size = self.__get_size_from_db()
+        # The size cached on creation is only used by INVOKE on defective revisions.
+        # A cached SCORE instance can be created in another context type and used by INVOKE later,
+        # so the read is skipped only once the revision, which never goes back, is over defective ones
+        self.__legacy_size: int = 0 if self.__is_over_defective_revision() else self.__get_size_from_db()
 
     def put(self, value: V) -> None:
         """
@@ -320,6 +390,11 @@ class ArrayDB(object):
                 return True
         return False
 
+    @classmethod
+    def __is_over_defective_revision(cls) -> bool:
+        context = ContextContainer._get_context()
+        return context.revision >= Revision.THREE.value
+
     @classmethod
     def __is_defective_revision(cls):
         context = ContextContainer._get_context()
@@ -343,8 +418,10 @@ class ArrayDB(object):
 
     @classmethod
     def _get_generator(cls, db: Union['IconScoreDatabase', 'IconScoreSubDatabase'], size: int, value_type: type):
+        # Every index in range(size) is valid, so index checks in _get() are skipped
+        decode_object = ContainerUtil.decode_object
         for index in range(size):
-            yield cls._get(db, size, index, value_type)
+            yield decode_object(db.get(get_encoded_key(index)), value_type)
 
 
 class VarDB(object):
@@ -386,6 +463,13 @@ class VarDB(object):
         self._db.delete(self.__var_byte_key)
 
 
+# container_id and a separator which every db prefix of each container starts with
+_CONTAINER_PREFIXES = {
+    ArrayDB: ARRAY_DB_ID + b'|',
+    DictDB: DICT_DB_ID + b'|',
+}
+
+
 def get_default_value(value_type: type) -> Any:
     if value_type == int:
         return 0
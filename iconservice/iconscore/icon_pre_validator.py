@@ -326,11 +326,11 @@ class IconPreValidator:
             raise OutOfBalanceException(msg)
 
     def _is_inactive_score(self, context: 'IconScoreContext', address: 'Address') -> bool:
-        is_contract = address.is_contract
-        is_zero_score_address = address == SYSTEM_SCORE_ADDRESS
-        is_score_active = self._is_score_active(context, address)
-        _is_inactive_score = is_contract and not is_zero_score_address and not is_score_active
-        return _is_inactive_score
+        # Cheap checks come first to avoid looking up deploy info of EOA or system score
+        if not address.is_contract or address == SYSTEM_SCORE_ADDRESS:
+            return False
+
+        return not self._is_score_active(context, address)
 
     @classmethod
     def _is_score_active(cls, context: 'IconScoreContext', address: 'Address') -> bool:
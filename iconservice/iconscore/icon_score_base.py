@@ -124,13 +124,14 @@ def eventlog(func=None, *, indexed=0):
     if not isfunction(func):
         raise IllegalFormatException(FORMAT_IS_NOT_FUNCTION_OBJECT.format(func, cls_name))
 
-    if not list(signature(func).parameters.keys())[0] == 'self':
+    sig_parameters = signature(func).parameters
+    if not list(sig_parameters.keys())[0] == 'self':
         raise InvalidEventLogException("'self' is not declared as the first parameter")
     if indexed > INDEXED_ARGS_LIMIT:
         raise InvalidEventLogException(
             f'Indexed arguments overflow: limit={INDEXED_ARGS_LIMIT}')
 
-    parameters = signature(func).parameters.values()
+    parameters = sig_parameters.values()
     if len(parameters) - 1 < indexed:
         raise InvalidEventLogException("Index exceeds the number of parameters")
 
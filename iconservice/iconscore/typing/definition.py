@@ -144,11 +144,9 @@ def _get_input(name: str, type_hint: type, default: Any) -> Dict:
 
 
 def _split_type_hint(type_hint: type) -> List[type]:
-    type_hints = [type_hint]
     ret = []
 
-    while len(type_hints) > 0:
-        type_hint = type_hints.pop(0)
+    while True:
         origin: type = get_origin(type_hint)
         ret.append(origin)
 
@@ -156,14 +154,14 @@ def _split_type_hint(type_hint: type) -> List[type]:
             args = get_args(type_hint)
             if len(args) != 1:
                 raise IllegalFormatException(f"Invalid type: {type_hint}")
-
-            type_hints.append(args[0])
         elif origin is Union:
             args = get_args(type_hint)
             if not (len(args) == 2 and args[1] is type(None)):
                 raise IllegalFormatException(f"Invalid type: {type_hint}")
+        else:
+            break
 
-            type_hints.append(args[0])
+        type_hint = args[0]
 
     return ret
 
@@ -199,24 +197,33 @@ def _get_fields(struct: type) -> List[dict]:
     :param struct: struct type
     :return:
     """
-    # annotations is a dictionary containing key-type pair
-    # which has field_name as a key and type as a value
-    annotations = struct.__annotations__
+    ret = []
+
+    # Nested structs are handled with a stack of (struct, fields to fill in)
+    # instead of calling _get_fields() recursively
+    stack = [(struct, ret)]
 
-    fields = []
-    for name, type_hint in annotations.items():
-        field = {"name": name}
+    while len(stack) > 0:
+        struct, fields = stack.pop()
 
-        type_hints: List[type] = _split_type_hint(type_hint)
-        field["type"] = _type_hints_to_name(type_hints)
+        # annotations is a dictionary containing key-type pair
+        # which has field_name as a key and type as a value
+        annotations = struct.__annotations__
 
-        last_type_hint: type = type_hints[-1]
-        if is_struct(last_type_hint):
-            field["fields"] = _get_fields(last_type_hint)
+        for name, type_hint in annotations.items():
+            field = {"name": name}
 
-        fields.append(field)
+            type_hints: List[type] = _split_type_hint(type_hint)
+            field["type"] = _type_hints_to_name(type_hints)
 
-    return fields
+            last_type_hint: type = type_hints[-1]
+            if is_struct(last_type_hint):
+                field["fields"] = []
+                stack.append((last_type_hint, field["fields"]))
+
+            fields.append(field)
+
+    return ret
 
 
 def _get_outputs(type_hint: type) -> List:
@@ -268,24 +268,32 @@ class FunctionMetadata(ScoreElementMetadata):
     """
     def __init__(self, func: callable):
         super().__init__(func)
+
+        # Score flags are fixed by decorators before the class is created,
+        # so the bit tests used on every external call are done only once here
+        flag: ScoreFlag = self.flag
+        self._is_external: bool = bool(flag & ScoreFlag.EXTERNAL)
+        self._is_payable: bool = bool(flag & ScoreFlag.PAYABLE)
+        self._is_readonly: bool = bool(flag & ScoreFlag.READONLY)
+        self._is_fallback: bool = utils.is_all_flag_on(flag, ScoreFlag.FALLBACK | ScoreFlag.PAYABLE)
+
         self._verify()
 
     @property
     def is_external(self) -> bool:
-        return bool(self.flag & ScoreFlag.EXTERNAL)
+        return self._is_external
 
     @property
     def is_payable(self) -> bool:
-        return bool(self.flag & ScoreFlag.PAYABLE)
+        return self._is_payable
 
     @property
     def is_readonly(self) -> bool:
-        return bool(self.flag & ScoreFlag.READONLY)
+        return self._is_readonly
 
     @property
     def is_fallback(self) -> bool:
-        return utils.is_all_flag_on(
-            self.flag, ScoreFlag.FALLBACK | ScoreFlag.PAYABLE)
+        return self._is_fallback
 
     def _verify(self):
         if self.is_fallback:
@@ -13,7 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional, Callable
 
 from iconcommons import Logger
 from .issue_formula import IssueFormula
@@ -30,6 +31,25 @@ if TYPE_CHECKING:
     from ...icx.icx_account import Account
 
 
+def _create_event_data_getter(data_keys: tuple) -> Callable[[dict], tuple]:
+    # itemgetter returns a bare value for a single key and can not be created without keys
+    if len(data_keys) == 0:
+        return lambda group_data: ()
+    if len(data_keys) == 1:
+        data_key = data_keys[0]
+        return lambda group_data: (group_data[data_key],)
+    return itemgetter(*data_keys)
+
+
+# Event signature and data getter of each issue group are resolved once
+# instead of being looked up from ISSUE_EVENT_LOG_MAPPER on every block
+_ISSUE_EVENT_LOG_META = {
+    group_key: (meta.event_signature, _create_event_data_getter(meta.data))
+    for group_key, meta in ISSUE_EVENT_LOG_MAPPER.items()
+}
+_TOTAL_ISSUE_EVENT_SIGNATURE: str = _ISSUE_EVENT_LOG_META[IssueDataKey.TOTAL][0]
+
+
 class Engine(EngineBase):
 
     def __init__(self):
@@ -42,25 +62,25 @@ class Engine(EngineBase):
 
     def create_icx_issue_info(self, context: 'IconScoreContext') -> dict:
         irep: int = context.engine.prep.term.irep
-        iiss_data_for_issue = {
-            IssueDataKey.PREP: {
-                IssueDataKey.IREP: irep,
-                IssueDataKey.RREP: context.storage.iiss.get_reward_rate(context).reward_prep,
-                IssueDataKey.TOTAL_DELEGATION: context.preps.total_delegated
-            }
+        prep_data: dict = {
+            IssueDataKey.IREP: irep,
+            IssueDataKey.RREP: context.storage.iiss.get_reward_rate(context).reward_prep,
+            IssueDataKey.TOTAL_DELEGATION: context.preps.total_delegated
         }
-        total_issue_amount = 0
-        for group in iiss_data_for_issue:
-            issue_amount_per_group = self._formula.calculate(context, group, iiss_data_for_issue[group])
-            iiss_data_for_issue[group][IssueDataKey.VALUE] = issue_amount_per_group
-            total_issue_amount += issue_amount_per_group
+
+        # PRep is the only group which ICX is issued for
+        total_issue_amount: int = self._formula.calculate_for_prep(context, prep_data)
+        prep_data[IssueDataKey.VALUE] = total_issue_amount
 
         context.regulator = Regulator(context, total_issue_amount)
 
-        iiss_data_for_issue[IssueDataKey.ISSUE_RESULT] = {
-            IssueDataKey.COVERED_BY_FEE: context.regulator.covered_icx_by_fee,
-            IssueDataKey.COVERED_BY_OVER_ISSUED_ICX: context.regulator.covered_icx_by_over_issue,
-            IssueDataKey.ISSUE: context.regulator.corrected_icx_issue_amount
+        iiss_data_for_issue = {
+            IssueDataKey.PREP: prep_data,
+            IssueDataKey.ISSUE_RESULT: {
+                IssueDataKey.COVERED_BY_FEE: context.regulator.covered_icx_by_fee,
+                IssueDataKey.COVERED_BY_OVER_ISSUED_ICX: context.regulator.covered_icx_by_over_issue,
+                IssueDataKey.ISSUE: context.regulator.corrected_icx_issue_amount
+            }
         }
         return iiss_data_for_issue
 
@@ -69,11 +89,12 @@ class Engine(EngineBase):
                to: 'Address',
                amount: int):
         if amount > 0:
-            to_account: 'Account' = context.storage.icx.get_account(context, to)
+            icx = context.storage.icx
+            to_account: 'Account' = icx.get_account(context, to)
             to_account.deposit(amount)
-            current_total_supply = context.storage.icx.get_total_supply(context)
-            context.storage.icx.put_account(context, to_account)
-            context.storage.icx.put_total_supply(context, current_total_supply + amount)
+            current_total_supply = icx.get_total_supply(context)
+            icx.put_account(context, to_account)
+            icx.put_total_supply(context, current_total_supply + amount)
             Logger.info(f"Issue icx. amount: {amount} "
                         f"Total supply: {current_total_supply + amount} "
                         f"Treasury: {to_account.balance}", ICX_LOG_TAG)
@@ -82,16 +103,17 @@ class Engine(EngineBase):
               context: 'IconScoreContext',
               to_address: 'Address',
               issue_data: dict):
-        assert isinstance(context.regulator, Regulator)
+        regulator: 'Regulator' = context.regulator
+        assert isinstance(regulator, Regulator)
 
-        self._issue(context, to_address, context.regulator.corrected_icx_issue_amount)
-        context.regulator.put_regulate_variable(context)
+        self._issue(context, to_address, regulator.corrected_icx_issue_amount)
+        regulator.put_regulate_variable(context)
 
         for group_key in ISSUE_CALCULATE_ORDER:
             if group_key not in issue_data:
                 continue
-            event_signature: str = ISSUE_EVENT_LOG_MAPPER[group_key]["event_signature"]
-            data: list = [issue_data[group_key][data_key] for data_key in ISSUE_EVENT_LOG_MAPPER[group_key]["data"]]
+            event_signature, get_event_data = _ISSUE_EVENT_LOG_META[group_key]
+            data: list = list(get_event_data(issue_data[group_key]))
             EventLogEmitter.emit_event_log(context,
                                            score_address=SYSTEM_SCORE_ADDRESS,
                                            event_signature=event_signature,
@@ -100,25 +122,26 @@ class Engine(EngineBase):
 
         EventLogEmitter.emit_event_log(context,
                                        score_address=SYSTEM_SCORE_ADDRESS,
-                                       event_signature=ISSUE_EVENT_LOG_MAPPER[IssueDataKey.TOTAL]["event_signature"],
-                                       arguments=[context.regulator.covered_icx_by_fee,
-                                                  context.regulator.covered_icx_by_over_issue,
-                                                  context.regulator.corrected_icx_issue_amount,
-                                                  context.regulator.remain_over_issued_icx],
+                                       event_signature=_TOTAL_ISSUE_EVENT_SIGNATURE,
+                                       arguments=[regulator.covered_icx_by_fee,
+                                                  regulator.covered_icx_by_over_issue,
+                                                  regulator.corrected_icx_issue_amount,
+                                                  regulator.remain_over_issued_icx],
                                        indexed_args_count=0)
 
     @staticmethod
     def _burn(context: 'IconScoreContext', address: 'Address', amount: int):
-        account: 'Account' = context.storage.icx.get_account(context, address)
+        icx = context.storage.icx
+        account: 'Account' = icx.get_account(context, address)
         if account.balance < amount:
             raise OutOfBalanceException(f'Not enough ICX to Burn: '
                                         f'balance({account.balance}) < intended burn amount({amount})')
         else:
             account.withdraw(amount)
-            current_total_supply = context.storage.icx.get_total_supply(context)
+            current_total_supply = icx.get_total_supply(context)
 
-            context.storage.icx.put_account(context, account)
-            context.storage.icx.put_total_supply(context, current_total_supply - amount)
+            icx.put_account(context, account)
+            icx.put_total_supply(context, current_total_supply - amount)
 
     def burn(self, context: 'IconScoreContext', address: 'Address', amount: int):
         self._burn(context, address, amount)
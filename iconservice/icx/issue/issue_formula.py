@@ -41,6 +41,13 @@ class IssueFormula(object):
                         total_delegation=data["totalDelegation"])
         return value
 
+    def calculate_for_prep(self, context: 'IconScoreContext', data: dict) -> int:
+        # prep handler is called directly without looking up the group
+        return self._handle_icx_issue_formula_for_prep(context=context,
+                                                       irep=data["irep"],
+                                                       rrep=data["rrep"],
+                                                       total_delegation=data["totalDelegation"])
+
     @staticmethod
     def calculate_rrep(rmin: int, rmax: int, rpoint: int, total_supply: int, total_delegated: int) -> int:
         stake_percentage: float = total_delegated / total_supply * IISS_MAX_REWARD_RATE
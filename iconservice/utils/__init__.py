@@ -21,7 +21,6 @@ Functions and classes in this module don't have any external dependencies.
 
 import hashlib
 import json
-import re
 from collections import namedtuple
 from enum import Flag
 from typing import Any, Union, Optional
@@ -31,6 +30,8 @@ from iconcommons import Logger
 
 from ..icon_constant import BUILTIN_SCORE_ADDRESS_MAPPER, DATA_BYTE_ORDER, ICX_IN_LOOP
 
+_LOWERCASE_HEX_DIGITS = b"0123456789abcdef"
+
 
 def int_to_bytes(n: int) -> bytes:
     length = byte_length_of_int(n)
@@ -66,13 +67,11 @@ def is_lowercase_hex_string(value: str) -> bool:
     :return: True(lowercase hexadecimal) otherwise False
     """
 
-    try:
-        result = re.match('[0-9a-f]+', value)
-        return len(result.group(0)) == len(value)
-    except:
-        pass
+    if not isinstance(value, str) or len(value) == 0 or not value.isascii():
+        return False
 
-    return False
+    # Nothing remains after removing all lowercase hex digits
+    return len(value.encode().translate(None, _LOWERCASE_HEX_DIGITS)) == 0
 
 
 def sha3_256(data: bytes) -> bytes:
@@ -142,6 +141,6 @@ class BytesToHexJSONEncoder(json.JSONEncoder):
     """
     def default(self, obj):
         if isinstance(obj, bytes):
-            return bytes_to_hex(obj)
+            return f"0x{obj.hex()}"
 
         return json.JSONEncoder.default(self, obj)
@@ -16,7 +16,7 @@
 
 import copy
 import hashlib
-from typing import Union, Iterable
+from typing import Union, Iterable, Optional
 
 from .hash_origin_generator import HashOriginGeneratorV1
 from .merkle_tree import MerkleTree
@@ -47,8 +47,29 @@ class HashGenerator:
 
 class RootHashGenerator:
     @classmethod
-    def generate_root_hash(cls, values: Union[Iterable, bytes, bytearray], do_hash=False) -> bytes:
-        merkle_tree = MerkleTree()
-        merkle_tree.add_leaf(values, do_hash)
-        merkle_tree.make_tree()
-        return merkle_tree.get_merkle_root()
+    def generate_root_hash(cls, values: Union[Iterable, bytes, bytearray], do_hash=False) -> Optional[bytes]:
+        # Builds the same root as MerkleTree, keeping only the current level
+        # because intermediate levels are needed for proofs only
+        hash_function = MerkleTree.hash_function
+
+        # check if single leaf
+        if not isinstance(values, Iterable):
+            values = [values]
+
+        if do_hash:
+            level: list = [hash_function(v).digest() for v in values]
+        else:
+            level: list = [bytes(v) for v in values]
+
+        if len(level) == 0:
+            return None
+
+        while len(level) > 1:
+            next_level: list = [hash_function(left + right).digest()
+                                for left, right in zip(level[0::2], level[1::2])]
+            if len(level) % 2 == 1:
+                # odd end node is moved to the next level as it is
+                next_level.append(level[-1])
+            level = next_level
+
+        return level[0]
@@ -313,8 +313,8 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
             if group_key not in issue_data:
                 continue
             expected_score_address = SYSTEM_SCORE_ADDRESS
-            expected_indexed: list = [ISSUE_EVENT_LOG_MAPPER[group_key]['event_signature']]
-            expected_data: list = [issue_data[group_key][key] for key in ISSUE_EVENT_LOG_MAPPER[group_key]['data']]
+            expected_indexed: list = [ISSUE_EVENT_LOG_MAPPER[group_key].event_signature]
+            expected_data: list = [issue_data[group_key][key] for key in ISSUE_EVENT_LOG_MAPPER[group_key].data]
             self.assertEqual(expected_score_address, tx_results[0].event_logs[index].score_address)
             self.assertEqual(expected_indexed, tx_results[0].event_logs[index].indexed)
             self.assertEqual(expected_data, tx_results[0].event_logs[index].data)
@@ -367,8 +367,8 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
             if group_key not in issue_data:
                 continue
             expected_score_address = SYSTEM_SCORE_ADDRESS
-            expected_indexed: list = [ISSUE_EVENT_LOG_MAPPER[group_key]['event_signature']]
-            expected_data: list = [issue_data[group_key][key] for key in ISSUE_EVENT_LOG_MAPPER[group_key]['data']]
+            expected_indexed: list = [ISSUE_EVENT_LOG_MAPPER[group_key].event_signature]
+            expected_data: list = [issue_data[group_key][key] for key in ISSUE_EVENT_LOG_MAPPER[group_key].data]
             self.assertEqual(expected_score_address, tx_results[0].event_logs[index].score_address)
             self.assertEqual(expected_indexed, tx_results[0].event_logs[index].indexed)
             self.assertEqual(expected_data, tx_results[0].event_logs[index].data)
@@ -637,22 +637,22 @@ class TestTransactionValidator(unittest.TestCase):
         address = create_address()
         self.validator._is_score_active = Mock(return_value=True)
         self.assertFalse(self.validator._is_inactive_score(self.context, address))
-        self.validator._is_score_active.assert_called_once_with(self.context, address)
+        self.validator._is_score_active.assert_not_called()
 
         address = create_address()
         self.validator._is_score_active = Mock(return_value=False)
         self.assertFalse(self.validator._is_inactive_score(self.context, address))
-        self.validator._is_score_active.assert_called_once_with(self.context, address)
+        self.validator._is_score_active.assert_not_called()
 
         address = SYSTEM_SCORE_ADDRESS
         self.validator._is_score_active = Mock(return_value=True)
         self.assertFalse(self.validator._is_inactive_score(self.context, address))
-        self.validator._is_score_active.assert_called_once_with(self.context, address)
+        self.validator._is_score_active.assert_not_called()
 
         address = SYSTEM_SCORE_ADDRESS
         self.validator._is_score_active = Mock(return_value=False)
         self.assertFalse(self.validator._is_inactive_score(self.context, address))
-        self.validator._is_score_active.assert_called_once_with(self.context, address)
+        self.validator._is_score_active.assert_not_called()
 
         address = create_address(1)
         self.validator._is_score_active = Mock(return_value=True)
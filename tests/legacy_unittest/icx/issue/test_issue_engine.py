@@ -1,12 +1,13 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
 from iconservice import ZERO_SCORE_ADDRESS, Address
-from iconservice.icon_constant import Revision
+from iconservice.icon_constant import Revision, IssueDataKey
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iconscore.icon_score_event_log import EventLogEmitter
-from iconservice.icx.issue.engine import Engine as IssueEngine
+from iconservice.icx.issue.engine import Engine as IssueEngine, _create_event_data_getter
+from iconservice.icx.issue.regulator import Regulator
 from tests import create_address
 
 
@@ -32,6 +33,17 @@ def event_log_emitter(monkeypatch):
     monkeypatch.undo()
 
 
+@pytest.mark.parametrize("data_keys,expected", [
+    ((), ()),
+    (("a",), (1,)),
+    (("a", "c"), (1, 3)),
+    (("c", "b", "a"), (3, 2, 1)),
+])
+def test_create_event_data_getter(data_keys, expected):
+    get_event_data = _create_event_data_getter(data_keys)
+    assert get_event_data({"a": 1, "b": 2, "c": 3}) == expected
+
+
 class TestIssueEngine:
 
     def test_burn_event_log_should_be_fixed_after_revision_9(self, context, issue_engine):
@@ -51,3 +63,77 @@ class TestIssueEngine:
                                                           event_signature=expected_signature,
                                                           arguments=expected_arguments,
                                                           indexed_args_count=expected_indexed_args_count)
+
+    def test_issue_event_logs(self, context, issue_engine, monkeypatch):
+        monkeypatch.setattr(IssueEngine, "_issue", Mock())
+        context.regulator = Mock(spec=Regulator)
+        context.regulator.covered_icx_by_fee = 1
+        context.regulator.covered_icx_by_over_issue = 2
+        context.regulator.corrected_icx_issue_amount = 3
+        context.regulator.remain_over_issued_icx = 4
+        to: 'Address' = create_address()
+        issue_data: dict = {
+            IssueDataKey.PREP: {
+                IssueDataKey.IREP: 10,
+                IssueDataKey.RREP: 20,
+                IssueDataKey.TOTAL_DELEGATION: 30,
+                IssueDataKey.VALUE: 40
+            }
+        }
+
+        issue_engine.issue(context, to, issue_data)
+
+        issue_engine._issue.assert_called_once_with(context, to, 3)
+        context.regulator.put_regulate_variable.assert_called_once_with(context)
+        EventLogEmitter.emit_event_log.assert_has_calls([
+            call(context,
+                 score_address=ZERO_SCORE_ADDRESS,
+                 event_signature="PRepIssued(int,int,int,int)",
+                 arguments=[10, 20, 30, 40],
+                 indexed_args_count=0),
+            call(context,
+                 score_address=ZERO_SCORE_ADDRESS,
+                 event_signature="ICXIssued(int,int,int,int)",
+                 arguments=[1, 2, 3, 4],
+                 indexed_args_count=0)
+        ])
+        assert EventLogEmitter.emit_event_log.call_count == 2
+
+    def test_create_icx_issue_info(self, context, issue_engine, monkeypatch):
+        regulator = Mock(spec=Regulator)
+        regulator.covered_icx_by_fee = 1
+        regulator.covered_icx_by_over_issue = 2
+        regulator.corrected_icx_issue_amount = 3
+        regulator_class = Mock(return_value=regulator)
+        monkeypatch.setattr("iconservice.icx.issue.engine.Regulator", regulator_class)
+
+        context.engine.prep.term.irep = 10
+        context.storage.iiss.get_reward_rate.return_value.reward_prep = 20
+        context.preps.total_delegated = 30
+        calculated_data: list = []
+
+        def calculate_for_prep(_context, data):
+            calculated_data.append(dict(data))
+            return 40
+
+        issue_engine._formula = Mock()
+        issue_engine._formula.calculate_for_prep.side_effect = calculate_for_prep
+
+        issue_data: dict = issue_engine.create_icx_issue_info(context)
+
+        expected_prep_data = {
+            IssueDataKey.IREP: 10,
+            IssueDataKey.RREP: 20,
+            IssueDataKey.TOTAL_DELEGATION: 30,
+        }
+        assert calculated_data == [expected_prep_data]
+        regulator_class.assert_called_once_with(context, 40)
+        assert context.regulator == regulator
+        assert issue_data == {
+            IssueDataKey.PREP: {**expected_prep_data, IssueDataKey.VALUE: 40},
+            IssueDataKey.ISSUE_RESULT: {
+                IssueDataKey.COVERED_BY_FEE: 1,
+                IssueDataKey.COVERED_BY_OVER_ISSUED_ICX: 2,
+                IssueDataKey.ISSUE: 3
+            }
+        }
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import Mock
 
 from iconservice.icx.issue.issue_formula import IssueFormula
 
@@ -112,4 +113,13 @@ class TestIssueFormula(unittest.TestCase):
         rpoint = 7000
         for x in range(0, 100):
             ret = IssueFormula.calculate_rrep(rmin, rmax, rpoint, 100, x)
-            assert abs(ret - EXPECTED_REWARD_RATE_PER_STAKE_PERCENTAGE[x]) <= 1
\ No newline at end of file
+            assert abs(ret - EXPECTED_REWARD_RATE_PER_STAKE_PERCENTAGE[x]) <= 1
+
+    def test_calculate_for_prep(self):
+        formula = IssueFormula(22)
+        data = {"irep": 50_000 * 10 ** 18, "rrep": 1_000, "totalDelegation": 10 ** 25}
+        for is_decentralized in (True, False):
+            context = Mock()
+            context.is_decentralized.return_value = is_decentralized
+            context.term.total_delegated = 10 ** 25
+            assert formula.calculate_for_prep(context, data) == formula.calculate(context, "prep", data)
@@ -40,6 +40,14 @@ class TestUtils(unittest.TestCase):
         a = '72917492AF'
         self.assertFalse(is_lowercase_hex_string(a))
 
+        a = '0067879 2645ed9f'
+        self.assertFalse(is_lowercase_hex_string(a))
+
+        # non-ascii or non-str value is not hexadecimal.
+        self.assertFalse(is_lowercase_hex_string('00ff\uff10'))
+        self.assertFalse(is_lowercase_hex_string(b'00ff'))
+        self.assertFalse(is_lowercase_hex_string(None))
+
     def test_byte_length_of_int(self):
         n = 0x80
         for i in range(0, 32):
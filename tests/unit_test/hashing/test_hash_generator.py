@@ -13,9 +13,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 import pytest
 
-from iconservice.utils.hashing.hash_generator import HashGenerator
+from iconservice.utils.hashing.hash_generator import HashGenerator, RootHashGenerator
+from iconservice.utils.hashing.merkle_tree import MerkleTree
 
 tx_data1 = {
         "from": "hx930eb8a0e793253aad876503367c344fe8d4e282",
@@ -62,3 +65,18 @@ def test_generate_hash(tx_data, tx_hash):
     actual_tx_hash = HashGenerator.generate_hash(tx_data)
 
     assert actual_tx_hash == tx_hash
+
+
+@pytest.mark.parametrize("do_hash", [True, False])
+@pytest.mark.parametrize("leaf_count", range(0, 18))
+def test_generate_root_hash(leaf_count, do_hash):
+    leaves: list = [os.urandom(21) for _ in range(leaf_count)]
+    merkle_tree = MerkleTree()
+    merkle_tree.add_leaf(leaves, do_hash)
+    merkle_tree.make_tree()
+
+    root_hash = RootHashGenerator.generate_root_hash(leaves, do_hash)
+
+    assert root_hash == merkle_tree.get_merkle_root()
+    if leaf_count == 0:
+        assert root_hash is None
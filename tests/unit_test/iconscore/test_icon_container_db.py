@@ -19,9 +19,11 @@ import pytest
 from iconservice import Address
 from iconservice.base.address import AddressPrefix
 from iconservice.base.exception import InvalidParamsException
+from iconservice.icon_constant import Revision
 from iconservice.database.db import IconScoreDatabase
 from iconservice.iconscore.context.context import ContextContainer
-from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB
+from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB, get_encoded_key, \
+    _get_encoded_int_key
 from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
 from tests import create_address
 
@@ -104,6 +106,17 @@ class TestIconContainerDB:
         prefix: bytes = ContainerUtil.create_db_prefix(DictDB, name)
         assert prefix == b'\x01|' + name.encode()
 
+    def test_set(self, score_db):
+        test_set = {'c', 'a', 'b'}
+        ContainerUtil.put_to_db(score_db, 'test_set', test_set)
+
+        for index, expected_value in enumerate(sorted(test_set)):
+            assert ContainerUtil.get_from_db(score_db, 'test_set', index, value_type=str) == expected_value
+
+        ContainerUtil.put_to_db(score_db, 'test_set', {self.ADDRESS, 1})
+        assert ContainerUtil.get_from_db(score_db, 'test_set', 0, value_type=int) == 1
+        assert ContainerUtil.get_from_db(score_db, 'test_set', 1, value_type=Address) == self.ADDRESS
+
     def test_dict_depth1(self, score_db):
         name = 'test_dict'
         test_dict = DictDB(name, score_db, value_type=int)
@@ -218,10 +231,38 @@ class TestIconContainerDB:
             assert array[index] == array[negative_index]
             negative_index -= 1
 
+    def test_array_db_does_not_read_size_on_creation(self, context, score_db, mocker):
+        context._inv_container = mocker.Mock(revision_code=Revision.THREE.value)
+        spy = mocker.spy(score_db, "get")
+        array = ArrayDB('array', score_db, value_type=int)
+        spy.assert_not_called()
+
+        array.put(1)
+        assert len(array) == 1
+
+    def test_array_db_created_on_query_and_used_on_invoke(self, context, score_db, mocker):
+        # A cached SCORE instance can be created on QUERY and used on INVOKE under defective revisions
+        context._inv_container = mocker.Mock(revision_code=Revision.TWO.value)
+        array = ArrayDB('array', score_db, value_type=int)
+        for i in range(3):
+            array.put(i)
+
+        context.type = IconScoreContextType.QUERY
+        array = ArrayDB('array', score_db, value_type=int)
+
+        context.type = IconScoreContextType.INVOKE
+        mocker.patch.object(context, "get_batches", return_value=[])
+        assert len(array) == 3
+        assert list(array) == [0, 1, 2]
+
     @pytest.mark.parametrize("value_type, expected_value", [
         (int, 10 ** 19 + 1),
         (Address, create_address(AddressPrefix.CONTRACT)),
-        (Address, create_address(AddressPrefix.EOA))
+        (Address, create_address(AddressPrefix.EOA)),
+        (bool, True),
+        (bool, False),
+        (str, "hello"),
+        (bytes, b"hello"),
     ])
     def test_var_db(self, score_db, value_type, expected_value):
         test_var = VarDB('test_var', score_db, value_type=value_type)
@@ -331,3 +372,15 @@ class TestIconContainerDB:
     def test_when_create_var_db_prefix_using_container_util_should_raise_error(self):
         with pytest.raises(InvalidParamsException):
             ContainerUtil.create_db_prefix(VarDB, 'vardb')
+
+    @pytest.mark.parametrize("key", [0, 1, -1, 0x80, -0x80, 2 ** 256, True, 'a', b'a', ADDRESS])
+    def test_get_encoded_key(self, key):
+        # Calls twice to make sure that a cached value is the same as an encoded one
+        for _ in range(2):
+            assert get_encoded_key(key) == ContainerUtil.encode_key(key)
+
+    @pytest.mark.parametrize("key", [-1, 4096, 2 ** 256, 2 ** (8 * 1024)])
+    def test_get_encoded_key_does_not_cache_large_or_negative_int(self, key):
+        cache_size: int = _get_encoded_int_key.cache_info().currsize
+        assert get_encoded_key(key) == ContainerUtil.encode_key(key)
+        assert _get_encoded_int_key.cache_info().currsize == cache_size